@@ -1,155 +1,439 @@
+import atexit
 import csv
+import multiprocessing  # To spread URLs across worker processes
 import logging  # For logging warnings and status messages
+import queue    # Hands log records to the background logging thread; queue.Empty for worker results
 import asyncio  # Core library for async programming
+import random   # Jitter for retry backoff
+import re       # To validate URL format
+import socket   # Address family for connections
+import time     # Clock for flushing the output CSV
+import zlib     # Stable hash to assign hosts to worker processes
+from collections import namedtuple  # Lightweight result rows
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime  # To read HTTP-date Retry-After headers
+from logging.handlers import QueueHandler, QueueListener
 import aiohttp  # Asynchronous HTTP client
-from urllib.parse import urlparse   # To validate URL format
+try:
+    import uvloop as loop_module  # Faster libuv-based event loop (Linux/macOS)
+except ImportError:
+    try:
+        import winloop as loop_module  # Faster libuv-based event loop (Windows)
+    except ImportError:
+        loop_module = None
+# Releases without run() (e.g. uvloop < 0.18) fall back to the default asyncio event loop too
+run_event_loop = getattr(loop_module, "run", None) or asyncio.run
 
 # --- Configuration ---
 CSV_FILE = "task_2/input_urls.csv"  # Input CSV file containing URLs 
-CONCURRENCY_LIMIT = 10            # Max number of concurrent requests
+OUTPUT_FILE = "task_2/output_asyncio.csv"  # Output CSV file with status results
+CONCURRENCY_LIMIT = 64            # Max number of concurrent requests (split across worker processes)
+WORKER_PROCESSES = 1              # Opt-in: >1 splits hosts across processes (e.g. os.cpu_count()); each one re-reads the CSV
+QUEUE_SIZE = CONCURRENCY_LIMIT * 4  # Number of fetch workers, and max number of URLs read from the CSV and waiting for one
+IO_BUFFER_SIZE = 1 << 16          # Read the input CSV and write the output CSV in 64 KiB chunks
+FLUSH_INTERVAL = 1.0              # Write buffered results out to the output CSV at most this many seconds late (in seconds)
 RETRY_STATUS_CODES = {429, 503}   # Retry for these HTTP status codes (rate limit or unavailable)
+HEAD_FALLBACK_STATUS_CODES = {403, 405, 501}  # Servers/CDNs that reject HEAD are retried with GET
 MAX_RETRIES = 3                   # Retries to handle temporary issues like rate limiting, timeouts, or service unavailability.
-RETRY_DELAY = 2                   # Delay between retries (in seconds)
+RETRY_BACKOFF_START = 0.5         # Delay before the first retry (in seconds)
+RETRY_BACKOFF_FACTOR = 2          # Multiply the delay by this after every failed attempt
+MAX_RETRY_AFTER = 60              # Never wait longer than this (in seconds), whatever Retry-After asks for
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
+MAX_REDIRECTS = 5                 # Follow up to this many redirects per URL, give up on longer chains
+IP_FAMILY = socket.AF_INET        # IPv4 only: skips AAAA lookups. Use 0 (any family) on IPv6-only networks
 TIMEOUT_SECONDS = 50              # Older government sites and slower server e.g. academic journals take longer to respond
 
+# --- Result row: fields are in the same order as the output CSV columns ---
+Result = namedtuple("Result", "status url error")
+
 # --- Logging Setup ---
-# Configure logging to show only the message (no timestamps or levels)
-logging.basicConfig(level=logging.INFO, format="%(message)s")
+# Configure logging to show only the message (no timestamps or levels).
+# Records are put on a queue and written to stderr by a background thread,
+# so fetches never wait on console output or the handler lock.
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, logging.StreamHandler())
+logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[QueueHandler(log_queue)])
 logger = logging.getLogger(__name__)
+log_listener.start()
+atexit.register(log_listener.stop)  # Write out any queued records before exiting
 
 # --- Helper: Check if URL is valid ---
+# http(s) scheme followed by a non-empty network location (domain), matched in a single regex pass
+_URL_RE = re.compile(r"^https?://([^\s/?#]+)", re.IGNORECASE)
+
 def check_valid_url(url):
     """
     Check whether a URL has both a scheme (http/https) and a network location (domain).
+    Returns the lowercased network location for a valid URL, None otherwise.
     """
-    parsed = urlparse(url)
-    return bool(parsed.netloc) and bool(parsed.scheme)
+    match = _URL_RE.match(url)
+    return match[1].lower() if match else None
+
+# --- Helper: Write results to the output CSV ---
+def result_writer(out_file):
+    """
+    Return a write_result callback that adds rows to the buffered output CSV and flushes it
+    once FLUSH_INTERVAL seconds have passed since the last flush. Results show up in the file
+    while a long run is still going, without one flush and write syscall per URL.
+    """
+    writer = csv.writer(out_file)
+    next_flush = time.monotonic() + FLUSH_INTERVAL
+
+    def write_result(row):
+        nonlocal next_flush
+        writer.writerow(row)
+        now = time.monotonic()
+        if now >= next_flush:
+            out_file.flush()
+            next_flush = now + FLUSH_INTERVAL
+
+    return write_result
+
+# --- Helper: Read the Retry-After header ---
+def parse_retry_after(value):
+    """
+    Convert a Retry-After header value (delay in seconds or an HTTP date) to seconds.
+    Returns None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdecimal() and value.isascii():
+        return int(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+# --- Helper: Delay before the next retry ---
+def retry_delay(attempt, response=None):
+    """
+    Return how long to wait before retrying. A Retry-After header sent by the server (in seconds or
+    as an HTTP date, capped at MAX_RETRY_AFTER) wins, otherwise back off exponentially.
+    Jitter is added either way so retries for many URLs don't fire in lockstep.
+    """
+    if response is not None:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return min(retry_after, MAX_RETRY_AFTER) + random.uniform(0, 0.5)
+    delay = RETRY_BACKOFF_START * RETRY_BACKOFF_FACTOR ** (attempt - 1)
+    return random.uniform(delay / 2, delay)
+
+# --- Admission control for concurrent fetches ---
+class Admission:
+    """
+    Limit the number of in-flight fetches with a counter guarded by a condition.
+    Unlike a semaphore, the limit can be changed at runtime with set_limit().
+    """
+
+    def __init__(self, n):
+        self._n = 0
+        self._max = n
+        self._cv = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._cv:
+            await self._cv.wait_for(lambda: self._n < self._max)
+            self._n += 1
+
+    async def release(self):
+        async with self._cv:
+            self._n -= 1
+            self._cv.notify()
+
+    async def set_limit(self, new):
+        """
+        Change the concurrency limit, e.g. raise it again once a 429 backoff ends.
+        Waiters are woken up on increase; on decrease in-flight fetches simply drain.
+        """
+        async with self._cv:
+            self._max = new
+            self._cv.notify_all()
+
+# --- Fetch only the response status ---
+async def fetch_response(session, url, ssl):
+    """
+    Request the URL with HEAD, since only the status code is needed and HEAD skips the body transfer.
+    Servers that reject HEAD (403, 405, 501) are asked once more with GET. The body is never read.
+    """
+    # aiohttp gives up once the number of redirects reaches max_redirects, so allow one more
+    # to still follow exactly MAX_REDIRECTS of them
+    async with session.head(url, ssl=ssl, allow_redirects=True, max_redirects=MAX_REDIRECTS + 1) as response:
+        response.release()
+        if response.status not in HEAD_FALLBACK_STATUS_CODES:
+            return response
+    async with session.get(url, ssl=ssl, allow_redirects=True, max_redirects=MAX_REDIRECTS + 1) as response:
+        # Hand the connection back as soon as the status is known. aiohttp keeps it alive when the
+        # (usually short) body has already arrived and only closes it if the rest is still pending
+        response.release()
+        return response
 
 # --- Retry logic for fetching a URL ---
-# --- Retry logic for fetching a URL ---
-async def fetch_with_retry(session, url):
+async def fetch_with_retry(adm, session, url):
     """
     Attempt to fetch the URL using retries if it fails or returns specific retr-able status codes.
-    Returns a dict with URL, status code (or 'ERROR'), and error type if any.
+    Returns a Result with status code (or 'ERROR'), URL, and error type if any.
     """
-    headers = {"User-Agent": USER_AGENT}
-    last_status_code = None
-    last_error_type = "UnknownError"
-    last_error_message = ""
+    await adm.acquire()
+    try:
+        last_status_code = None
+        last_error_type = "UnknownError"
+        last_error_message = ""
 
-    for attempt in range(1, MAX_RETRIES + 1):
-        try:
-            # Default: verify SSL
+        verify_ssl = True  # Default: verify SSL
+        attempt = 1
+        while attempt <= MAX_RETRIES:
             try:
-                async with session.get(url, headers=headers, ssl=True, allow_redirects=True, timeout=TIMEOUT_SECONDS) as response:
-                    last_status_code = response.status
-                    # Retry for specific HTTP codes like 429 (rate-limiting) or 503 (service unavailable)
-                    if response.status in RETRY_STATUS_CODES:
-                        logger.warning(f"[Retrying] ({response.status}) {url} - attempt {attempt}")
-                        await asyncio.sleep(RETRY_DELAY)
-                        continue
-                    # Log successful response
-                    logger.info(f"({response.status}) {url}")
-                    return {"URL": url, "Status": response.status, "Error": ""}
+                response = await fetch_response(session, url, ssl=verify_ssl)
+                last_status_code = response.status
+                # Retry for specific HTTP codes like 429 (rate-limiting) or 503 (service unavailable)
+                if response.status in RETRY_STATUS_CODES:
+                    logger.warning(f"[Retrying] ({response.status}) {url} - attempt {attempt}")
+                    # No point waiting after the last attempt, the result won't change
+                    if attempt < MAX_RETRIES:
+                        await asyncio.sleep(retry_delay(attempt, response))
+                    attempt += 1
+                    continue
+                # Log successful response
+                logger.info(f"({response.status}) {url}")
+                return Result(response.status, url, "" if verify_ssl else "SSL certificate verification disabled")
             except aiohttp.ClientConnectorCertificateError:
-                # Fallback for SSL certificate error
+                # Fallback for SSL certificate error: retry right away within the same attempt.
+                # Can only be raised while verify_ssl is still True, so this happens at most once.
                 logger.warning(f"[SSL Warning] Invalid cert for {url}, retrying without SSL verification.")
-                async with session.get(url, headers=headers, ssl=False, allow_redirects=True, timeout=TIMEOUT_SECONDS) as response:
-                    last_status_code = response.status
-                    if response.status in RETRY_STATUS_CODES:
-                        logger.warning(f"[Retrying] ({response.status}) {url} - attempt {attempt}")
-                        await asyncio.sleep(RETRY_DELAY)
-                        continue
-                    logger.info(f"({response.status}) {url}")
-                    return {"URL": url, "Status": response.status, "Error": "SSL certificate verification disabled"}
-        # Handle specific exceptions to identify the type of error that occurred
-        except aiohttp.ClientResponseError as e:
-            last_error_type = f"ClientResponseError ({e.status})"
-            last_error_message = str(e)
-        except aiohttp.ClientConnectorError as e:
-            last_error_type = "ClientConnectorError"
-            last_error_message = str(e)
-        except aiohttp.ClientPayloadError as e:
-            last_error_type = "ClientPayloadError"
-            last_error_message = str(e)
-        except asyncio.TimeoutError:
-            last_error_type = "TimeoutError"
-            last_error_message = "The request timed out"
-        except Exception as e:
-            last_error_type = type(e).__name__
-            last_error_message = str(e)
-
-        # Log retry on exception
-        logger.warning(f"[Retrying] (Exception) {url} - {last_error_type}: {last_error_message}, attempt {attempt}")
-        await asyncio.sleep(RETRY_DELAY)
-
-    # If all retries failed, return with error details
-    return {
-        "URL": url,
-        "Status": last_status_code if last_status_code else "ERROR",
-        "Error": f"{last_error_type}: {last_error_message}",
-    }
-
-
-# --- Wrapper with semaphore control ---
-async def fetch_url_with_limit(sem, session, url):
-    """
-    Use a semaphore to limit the number of concurrent fetches.
-    """
-    async with sem:
-        return await fetch_with_retry(session, url)
-
-# --- Read CSV, check validity, and fetch status ---
-async def process_urls_from_csv(filename):
-    """
-    Read URLs from a CSV file, validate them, and asynchronously fetch their status.
-    Returns a list of result dictionaries for each URL.
-    """
-    results = []
-
-    # Read URLs from the CSV
-    with open(filename, newline='', encoding='utf-8') as csvfile:
+                verify_ssl = False
+                continue
+            except aiohttp.TooManyRedirects as e:
+                # A redirect loop or overly long chain won't fix itself, so don't spend retries on it
+                logger.warning(f"[TooManyRedirects] {url} - more than {MAX_REDIRECTS} redirects")
+                # The last response in the history is a redirect too; its Location is the hop not taken
+                location = e.history[-1].headers.get("Location") if e.history else None
+                next_hop = f" (next hop: {location})" if location else ""
+                return Result("ERROR", url, f"TooManyRedirects: more than {MAX_REDIRECTS} redirects{next_hop}")
+            # Handle specific exceptions to identify the type of error that occurred
+            except aiohttp.ClientResponseError as e:
+                last_error_type = f"ClientResponseError ({e.status})"
+                last_error_message = str(e)
+            except aiohttp.ClientConnectorError as e:
+                last_error_type = "ClientConnectorError"
+                last_error_message = str(e)
+            except aiohttp.ClientPayloadError as e:
+                last_error_type = "ClientPayloadError"
+                last_error_message = str(e)
+            except asyncio.TimeoutError:
+                last_error_type = "TimeoutError"
+                last_error_message = "The request timed out"
+            except Exception as e:
+                last_error_type = type(e).__name__
+                last_error_message = str(e)
+
+            # Log retry on exception
+            logger.warning(f"[Retrying] (Exception) {url} - {last_error_type}: {last_error_message}, attempt {attempt}")
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(retry_delay(attempt))
+            attempt += 1
+
+        # If all retries failed, return with error details
+        return Result(
+            last_status_code if last_status_code else "ERROR",
+            url,
+            f"{last_error_type}: {last_error_message}",
+        )
+    finally:
+        await adm.release()
+
+# --- Fetch queued URLs ---
+async def fetch_worker(adm, session, url_queue, write_result):
+    """
+    Fetch queued URLs until the reader sends None. Several workers drain the same queue, so the
+    URLs of one host are fetched concurrently (up to limit_per_host) and reuse the kept-alive
+    connections the connector pools for that host.
+    """
+    while (url := await url_queue.get()) is not None:
+        write_result(await fetch_with_retry(adm, session, url))
+
+# --- Read CSV, check validity and fetch status ---
+async def check_urls_from_csv(filename, write_result, shard_index=0, shard_count=1, adm=None):
+    """
+    Stream URLs from a CSV file, validate them, and asynchronously fetch their status.
+    URLs are handed to a pool of fetch workers while the file is still being read. Reading only
+    pauses once QUEUE_SIZE URLs are waiting for a free worker, so memory does not grow with the
+    size of the CSV. write_result is called with each Result (status, URL, error) as soon as it
+    is ready.
+
+    With shard_count > 1 only URLs whose host hashes to shard_index are checked (invalid URLs
+    belong to shard 0), so several processes can split one CSV between them. The concurrency
+    limits are divided between the shards. Returns the number of URLs checked.
+
+    The worker pool is larger than the concurrency limit and every fetch waits for adm, so the
+    limit can be changed with adm.set_limit() while the file is being checked. Pass an Admission
+    to keep a handle on it; by default one with CONCURRENCY_LIMIT slots is created.
+    """
+    concurrency_limit = max(1, CONCURRENCY_LIMIT // shard_count)
+    pool_size = max(1, QUEUE_SIZE // shard_count)
+    # Set up concurrency limit
+    if adm is None:
+        adm = Admission(concurrency_limit)
+    url_queue = asyncio.Queue(maxsize=pool_size)
+    # Pool connections per host and cache DNS so repeated hosts skip the TCP/TLS handshake and lookup
+    connector = aiohttp.TCPConnector(
+        family=IP_FAMILY,
+        limit=pool_size,  # Room for every worker if the admission limit is raised
+        limit_per_host=concurrency_limit,
+        ttl_dns_cache=300,
+        use_dns_cache=True,
+        enable_cleanup_closed=True,
+    )
+    timeout = aiohttp.ClientTimeout(total=TIMEOUT_SECONDS)
+    total = 0
+
+    with open(filename, newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as csvfile:
         reader = csv.reader(csvfile)
         header = next(reader, None)  # Skip header
         if not header:
             raise ValueError("CSV file is missing a header")
-        urls = [row[0].strip() for row in reader if row and row[0].strip()]
-
-    valid_urls = []
-    for url in urls:
-        if check_valid_url(url):
-            valid_urls.append(url)
-        else:
-            # Handle invalid or empty URLs
-            error = "Invalid URL format" if url else "Empty URL"
-            logger.warning(f"[Invalid] {url} - {error}")
-            print(f"[Invalid] {url} - {error}")
-            results.append({"URL": url, "Status": "Invalid", "Error": error})
+        urls = (url for row in reader if row and (url := row[0].strip()))
 
-    # Set up concurrency limit
-    sem = asyncio.Semaphore(CONCURRENCY_LIMIT)
-    async with aiohttp.ClientSession() as session:
-        tasks = [fetch_url_with_limit(sem, session, url) for url in valid_urls]
-        responses = await asyncio.gather(*tasks)
-        results.extend(responses)
+        # The User-Agent header is set once here and sent with every request.
+        # Keep the read buffer tiny: only status lines and headers are ever needed
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers={"User-Agent": USER_AGENT}, read_bufsize=1024
+        ) as session:
+            reading = asyncio.current_task()
+            failed = []
 
-    return results
+            def on_worker_done(worker):
+                # A worker that raised (e.g. writing a result failed) stops taking URLs, so the
+                # reader would wait forever on a full queue. Interrupt it to re-raise the error
+                if not worker.cancelled() and worker.exception() is not None:
+                    if not failed:
+                        reading.cancel()
+                    failed.append(worker)
 
-# --- Write final results to output CSV ---
-def write_to_csv_file(url_results, filename="task_2/output_asyncio.csv"):
+            # More workers than admission slots, so raising the limit takes effect right away
+            workers = [
+                asyncio.create_task(fetch_worker(adm, session, url_queue, write_result))
+                for _ in range(pool_size)
+            ]
+            for worker in workers:
+                worker.add_done_callback(on_worker_done)
+            try:
+                for url in urls:
+                    host = check_valid_url(url)
+                    if not host:
+                        if shard_index != 0:
+                            continue
+                        total += 1
+                        # Handle invalid or empty URLs
+                        error = "Invalid URL format" if url else "Empty URL"
+                        logger.warning(f"[Invalid] {url} - {error}")
+                        print(f"[Invalid] {url} - {error}")
+                        write_result(Result("Invalid", url, error))
+                        continue
+                    # crc32 rather than hash(): string hashes are randomized per process
+                    if shard_count > 1 and zlib.crc32(host.encode()) % shard_count != shard_index:
+                        continue
+                    total += 1
+
+                    # Waits only while the queue is full, so reading never runs far ahead of fetching
+                    await url_queue.put(url)
+
+                # One None per worker tells the pool that the whole file has been read
+                for _ in workers:
+                    await url_queue.put(None)
+                await asyncio.gather(*workers)
+            except asyncio.CancelledError:
+                if failed:
+                    raise failed[0].exception()
+                raise
+            finally:
+                # Don't leave workers behind when reading or a worker failed
+                for worker in workers:
+                    worker.cancel()
+
+    return total
+
+# --- Check all URLs in this process and write the output CSV ---
+async def process_urls_from_csv(filename, output_filename=OUTPUT_FILE, adm=None):
+    """
+    Check every URL of the input CSV on the current event loop and write the results
+    to the output CSV as they arrive. Pass an Admission as adm to change the concurrency
+    limit while running. Returns the number of URLs written.
+    """
+    with open(output_filename, "w", newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as out_file:
+        write_result = result_writer(out_file)
+        write_result(["Status Code or Error", "URL", "Error"])  # Header row
+        # Results are written as-is since Result fields follow the column order
+        return await check_urls_from_csv(filename, write_result, adm=adm)
+
+# --- Worker process: check one shard of the URLs ---
+def run_shard(filename, shard_index, shard_count, result_queue):
     """
-    Write the results (status, URL, error) to a new CSV file.
+    Check the URLs of one shard on this process's own event loop and send each result
+    to the writer through result_queue. A final shard_index tells the writer this shard is done.
     """
-    with open(filename, "w", newline='', encoding='utf-8') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["Status Code or Error", "URL", "Error"])  # Header row
-        for row in url_results:
-            writer.writerow([row["Status"], row["URL"], row["Error"]])
+    try:
+        run_event_loop(check_urls_from_csv(filename, result_queue.put, shard_index, shard_count))
+    finally:
+        result_queue.put(shard_index)
+
+# --- Split the URLs across worker processes and write the output CSV ---
+def process_urls_in_parallel(filename, output_filename=OUTPUT_FILE, workers=WORKER_PROCESSES):
+    """
+    Shard the URLs by host across several worker processes, each running its own event loop,
+    so parsing and TLS work use more than one CPU core. URLs of the same host always land in the
+    same worker, keeping connection reuse and DNS caching local to it. This process is the only
+    writer of the output CSV. Returns the number of URLs written.
+    """
+    # spawn gives every worker a fresh interpreter (and its own logging thread) on every platform
+    mp_context = multiprocessing.get_context("spawn")
+    result_queue = mp_context.Queue()
+    processes = [
+        mp_context.Process(target=run_shard, args=(filename, shard_index, workers, result_queue))
+        for shard_index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    total = 0
+    with open(output_filename, "w", newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as out_file:
+        write_result = result_writer(out_file)
+        write_result(["Status Code or Error", "URL", "Error"])  # Header row
+        finished = set()
+        while len(finished) < workers:
+            try:
+                result = result_queue.get(timeout=1)
+            except queue.Empty:
+                # A worker that was killed or crashed before its finally block never sends its
+                # done marker; once it has exited and nothing is left to read, stop waiting for it
+                lost = [index for index, process in enumerate(processes)
+                        if index not in finished and process.exitcode is not None]
+                if lost and result_queue.empty():
+                    for process in processes:
+                        process.terminate()
+                    raise RuntimeError(f"Worker process(es) {lost} exited without finishing, results are incomplete")
+                continue
+            if isinstance(result, int):
+                finished.add(result)
+                continue
+            write_result(result)
+            total += 1
+
+    for process in processes:
+        process.join()
+    failed = [process.exitcode for process in processes if process.exitcode]
+    if failed:
+        raise RuntimeError(f"{len(failed)} worker process(es) failed, results are incomplete")
+    return total
 
 # --- Main Entry Point ---
 if __name__ == "__main__":
-    # Run the async processing and write results to CSV
-    url_results = asyncio.run(process_urls_from_csv(CSV_FILE))
-    write_to_csv_file(url_results)
-    print(f"\n Total {len(url_results)} URLs checked and results stored in output_asyncio.csv")
+    # Run the async processing; results are written to the output CSV as they arrive
+    if WORKER_PROCESSES > 1:
+        total = process_urls_in_parallel(CSV_FILE)
+    else:
+        total = run_event_loop(process_urls_from_csv(CSV_FILE))
+    print(f"\n Total {total} URLs checked and results stored in output_asyncio.csv")